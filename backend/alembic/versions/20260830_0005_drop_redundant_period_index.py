@@ -0,0 +1,40 @@
+"""drop redundant accounting period index
+
+Revision ID: 20260830_0005
+Revises: 20260305_0004
+Create Date: 2026-08-30
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260830_0005"
+down_revision = "20260305_0004"
+branch_labels = None
+depends_on = None
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return any(ix["name"] == index_name for ix in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    # (tenant_id, period_start) is a leading prefix of the unique index backing
+    # uq_period_dates (tenant_id, period_start, period_end), so this separate
+    # index only adds write amplification on period inserts.
+    if _has_index("accounting_periods", "ix_accounting_periods_tenant_start"):
+        op.drop_index(
+            "ix_accounting_periods_tenant_start", table_name="accounting_periods"
+        )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_accounting_periods_tenant_start",
+        "accounting_periods",
+        ["tenant_id", "period_start"],
+    )
@@ -0,0 +1,30 @@
+"""composite index for intercompany matching and ageing queries
+
+Revision ID: 20260830_0006
+Revises: 20260830_0005
+Create Date: 2026-08-30
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260830_0006"
+down_revision = "20260830_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_intercompany_tenant_matched_due",
+        "intercompany_transactions",
+        ["tenant_id", "is_matched", "due_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_intercompany_tenant_matched_due",
+        table_name="intercompany_transactions",
+    )
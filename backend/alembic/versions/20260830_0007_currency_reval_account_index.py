@@ -0,0 +1,30 @@
+"""composite index for latest-revaluation-per-account lookups
+
+Revision ID: 20260830_0007
+Revises: 20260830_0006
+Create Date: 2026-08-30
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260830_0007"
+down_revision = "20260830_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_currency_reval_tenant_account_period",
+        "currency_revaluations",
+        ["tenant_id", "account_id", "period_end"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_currency_reval_tenant_account_period",
+        table_name="currency_revaluations",
+    )
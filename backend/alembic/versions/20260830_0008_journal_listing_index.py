@@ -0,0 +1,44 @@
+"""composite index for journal listing filters
+
+Revision ID: 20260830_0008
+Revises: 20260830_0007
+Create Date: 2026-08-30
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260830_0008"
+down_revision = "20260830_0007"
+branch_labels = None
+depends_on = None
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return any(ix["name"] == index_name for ix in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_journals_tenant_period_status",
+        "journals",
+        ["tenant_id", "period_id", "status", "created_at"],
+    )
+    # (tenant_id, period_id) is a leading prefix of the new index, so the old
+    # one from 0002 only adds write amplification on journal inserts.
+    if _has_index("journals", "ix_journals_tenant_period"):
+        op.drop_index("ix_journals_tenant_period", table_name="journals")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_journals_tenant_period", "journals", ["tenant_id", "period_id"]
+    )
+    op.drop_index(
+        "ix_journals_tenant_period_status",
+        table_name="journals",
+    )
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import uuid
-from datetime import datetime, timezone
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +13,42 @@ def new_execution_id() -> str:
     return uuid.uuid4().hex
 
 
+def _dump(payload: dict[str, Any] | None) -> str:
+    # Most tool calls log an empty input or output; skip the encoder for
+    # those and use compact separators for the rest.
+    if not payload:
+        return "{}"
+    return json.dumps(payload, separators=(",", ":"))
+
+
+async def log_tool_calls(
+    db: AsyncSession,
+    execution_id: str,
+    tenant_id: uuid.UUID,
+    agent_name: str,
+    calls: list[tuple[str, dict[str, Any] | None, dict[str, Any] | None]],
+) -> None:
+    """Log several (tool_name, tool_input, tool_output) entries in one batch.
+
+    Agents that record every tool call of a run should prefer this over
+    repeated ``log_tool_call`` so the rows reach the session together and the
+    flush can batch the INSERTs.
+    """
+    db.add_all(
+        [
+            AgentExecutionLog(
+                execution_id=execution_id,
+                tenant_id=tenant_id,
+                agent_name=agent_name,
+                tool_name=tool_name,
+                tool_input=_dump(tool_input),
+                tool_output=_dump(tool_output),
+            )
+            for tool_name, tool_input, tool_output in calls
+        ]
+    )
+
+
 async def log_tool_call(
     db: AsyncSession,
     execution_id: str,
@@ -29,8 +64,7 @@ async def log_tool_call(
             tenant_id=tenant_id,
             agent_name=agent_name,
             tool_name=tool_name,
-            tool_input=json.dumps(tool_input or {}),
-            tool_output=json.dumps(tool_output or {}),
-            created_at=datetime.now(timezone.utc),
+            tool_input=_dump(tool_input),
+            tool_output=_dump(tool_output),
         )
     )
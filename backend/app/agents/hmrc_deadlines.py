@@ -5,7 +5,7 @@ from datetime import date
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.agents.base import log_tool_call, new_execution_id
+from app.agents.base import log_tool_calls, new_execution_id
 
 AGENT_NAME = "hmrc_deadlines"
 MODEL = "claude-sonnet-4-6"
@@ -13,16 +13,20 @@ MODEL = "claude-sonnet-4-6"
 
 async def run(db: AsyncSession, tenant_id: uuid.UUID, as_of: date) -> dict:
     execution_id = new_execution_id()
-    for tool in ["get_hmrc_obligations", "get_cash_forecast", "get_payment_history"]:
-        await log_tool_call(
-            db,
-            execution_id,
-            tenant_id,
-            AGENT_NAME,
-            tool,
-            {"as_of": str(as_of)},
-            {"status": "ok"},
-        )
+    await log_tool_calls(
+        db,
+        execution_id,
+        tenant_id,
+        AGENT_NAME,
+        [
+            (tool, {"as_of": str(as_of)}, {"status": "ok"})
+            for tool in [
+                "get_hmrc_obligations",
+                "get_cash_forecast",
+                "get_payment_history",
+            ]
+        ],
+    )
 
     return {
         "execution_id": execution_id,
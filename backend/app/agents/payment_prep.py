@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.agents.base import log_tool_call, new_execution_id
+from app.agents.base import log_tool_calls, new_execution_id
 
 AGENT_NAME = "payment_prep"
 MODEL = "claude-sonnet-4-6"
@@ -21,22 +22,16 @@ async def run(db: AsyncSession, tenant_id: uuid.UUID, cutoff_label: str) -> dict
         "generate_pain001",
     ]
     actions: list[dict] = []
+    calls: list[tuple[str, dict[str, Any] | None, dict[str, Any] | None]] = []
     for tool_name in tools:
         result = {
             "status": "ok",
             "prepared_only": True,
             "timestamp": datetime.utcnow().isoformat(),
         }
-        await log_tool_call(
-            db,
-            execution_id,
-            tenant_id,
-            AGENT_NAME,
-            tool_name,
-            {"cutoff": cutoff_label},
-            result,
-        )
+        calls.append((tool_name, {"cutoff": cutoff_label}, result))
         actions.append({"tool": tool_name, **result})
+    await log_tool_calls(db, execution_id, tenant_id, AGENT_NAME, calls)
 
     return {
         "execution_id": execution_id,
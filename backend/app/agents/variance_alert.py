@@ -5,7 +5,7 @@ from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.agents.base import log_tool_call, new_execution_id
+from app.agents.base import log_tool_calls, new_execution_id
 
 AGENT_NAME = "variance_alert"
 MODEL = "claude-sonnet-4-6"
@@ -20,14 +20,16 @@ async def run(db: AsyncSession, tenant_id: uuid.UUID) -> dict:
         "unmatched_intercompany_days": 0,
     }
 
-    await log_tool_call(
-        db, execution_id, tenant_id, AGENT_NAME, "get_actual_vs_forecast", {}, checks
-    )
-    await log_tool_call(
-        db, execution_id, tenant_id, AGENT_NAME, "get_position_movements", {}, checks
-    )
-    await log_tool_call(
-        db, execution_id, tenant_id, AGENT_NAME, "get_large_transactions", {}, checks
+    await log_tool_calls(
+        db,
+        execution_id,
+        tenant_id,
+        AGENT_NAME,
+        [
+            ("get_actual_vs_forecast", {}, checks),
+            ("get_position_movements", {}, checks),
+            ("get_large_transactions", {}, checks),
+        ],
     )
 
     triggered = (
@@ -67,14 +67,22 @@ def _pseudo(value: str, prefix: str = "REF") -> str:
     return f"{prefix}-{hashlib.sha256(value.encode()).hexdigest()[:12].upper()}"
 
 
+# Band boundaries and labels are fixed, so both the Decimal thresholds and
+# the formatted band strings are built once at import rather than per call.
+_AMOUNT_BANDS: list[tuple[Decimal, str]] = [
+    (Decimal(t), f"{prev:,}-{t:,}")
+    for prev, t in zip(
+        [0, 1_000, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000],
+        [1_000, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000],
+    )
+]
+
+
 def _amount_band(amount: Decimal) -> str:
     """Return a banded amount string instead of the exact figure."""
-    thresholds = [1_000, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000]
-    prev = 0
-    for t in thresholds:
-        if amount <= Decimal(str(t)):
-            return f"{prev:,}-{t:,}"
-        prev = t
+    for threshold, band in _AMOUNT_BANDS:
+        if amount <= threshold:
+            return band
     return "1,000,000+"
 
 
@@ -18,6 +18,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     Numeric,
@@ -240,10 +241,21 @@ class Journal(Base):
         "JournalLine",
         back_populates="journal",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
     __table_args__ = (
         UniqueConstraint("tenant_id", "journal_reference", name="uq_journal_reference"),
+        # list_journals filters tenant + period + status before ordering by
+        # created_at; without this the planner falls back to scanning every
+        # journal for the tenant.
+        Index(
+            "ix_journals_tenant_period_status",
+            "tenant_id",
+            "period_id",
+            "status",
+            "created_at",
+        ),
     )
 
 
@@ -399,6 +411,15 @@ class CurrencyRevaluation(Base):
             "account_id",
             name="uq_currency_reval_period_account",
         ),
+        # Latest-revaluation-per-account lookups filter on account and range
+        # over period_end; the unique constraint above leads with period_end
+        # so it cannot serve that scan.
+        Index(
+            "ix_currency_reval_tenant_account_period",
+            "tenant_id",
+            "account_id",
+            "period_end",
+        ),
     )
 
 
@@ -581,6 +602,17 @@ class IntercompanyTransaction(Base):
         DateTime(timezone=True), server_default=text("now()")
     )
 
+    __table_args__ = (
+        # Matching and ageing both filter tenant + is_matched (ageing adds a
+        # due_date comparison), so one composite serves both paths.
+        Index(
+            "ix_intercompany_tenant_matched_due",
+            "tenant_id",
+            "is_matched",
+            "due_date",
+        ),
+    )
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # CORPORATE INTEREST RESTRICTION (Phase-1, ORM mapping)
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from decimal import Decimal
 from typing import Literal
 
@@ -291,7 +292,7 @@ class AccountingPeriodService:
         """
         ct600, qips = _compute_tax_dates(period_end, large_company=is_large_company)
         return CtTaxDates(
-            period_end=period_end, ct600_due_date=ct600, qip_due_dates=qips
+            period_end=period_end, ct600_due_date=ct600, qip_due_dates=list(qips)
         )
 
     # ──────────────────────────────────────── helpers ──────────────────────────
@@ -311,10 +312,15 @@ class AccountingPeriodService:
 # ─────────────────────────────────────────────── pure functions ────────────────
 
 
+@lru_cache(maxsize=256)
 def _compute_tax_dates(
     period_end: date, large_company: bool = False
-) -> tuple[date, list[date]]:
-    """Return (ct600_due_date, qip_dates). qip_dates is empty for non-large companies."""
+) -> tuple[date, tuple[date, ...]]:
+    """Return (ct600_due_date, qip_dates). qip_dates is empty for non-large companies.
+
+    Pure function of its arguments, so results are memoised — tenants share
+    the same period-end dates and compute_ct_dates is hit per API call.
+    """
     # CT600: 9 months and 1 day after period end
     # Add 9 months by going to year+0..1 month calculation
     m = period_end.month + 9
@@ -346,7 +352,7 @@ def _compute_tax_dates(
                 last_day = calendar.monthrange(y2, m2)[1]
                 qip_dates.append(date(y2, m2, last_day))
 
-    return ct600, qip_dates
+    return ct600, tuple(qip_dates)
 
 
 def _has_any_role(user_roles: list[str], required: list[str]) -> bool:
@@ -4,13 +4,16 @@ import hashlib
 import secrets
 import uuid
 from datetime import datetime, timedelta, timezone
-from ipaddress import ip_address, ip_network
+from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Any, cast
 
 import bcrypt
 import pyotp
 from jose import jwt
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -30,6 +33,13 @@ from app.models import (
 )
 
 
+@lru_cache(maxsize=1024)
+def _parse_cidr(cidr: str) -> IPv4Network | IPv6Network:
+    """Parse an allowlist CIDR once; the entries are static per tenant but
+    re-checked on every request."""
+    return ip_network(cidr, strict=False)
+
+
 class LoginRequest(BaseModel):
     tenant_id: uuid.UUID
     email: EmailStr
@@ -412,17 +422,15 @@ class AuthService:
             .values(used_at=self._utcnow())
         )
 
-        backup_codes: list[str] = []
-        for _ in range(10):
-            code = secrets.token_hex(4)
-            backup_codes.append(code)
-            db.add(
-                MfaBackupCode(
-                    tenant_id=tenant_id,
-                    user_id=user_id,
-                    code_hash=self._hash_backup_code(code),
-                )
+        backup_codes = [secrets.token_hex(4) for _ in range(10)]
+        db.add_all(
+            MfaBackupCode(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                code_hash=self._hash_backup_code(code),
             )
+            for code in backup_codes
+        )
 
         return MfaSetupResponse(otpauth_uri=uri, backup_codes=backup_codes)
 
@@ -518,31 +526,30 @@ class AuthService:
         user_id: uuid.UUID,
         actor_id: uuid.UUID,
     ) -> int:
-        sessions = (
-            (
-                await db.execute(
-                    select(AuthSession).where(
-                        AuthSession.tenant_id == tenant_id,
-                        AuthSession.user_id == user_id,
-                        AuthSession.revoked_at.is_(None),
-                    )
+        # Single bulk UPDATE instead of loading every session row just to
+        # stamp revoked_at on it.
+        result = cast(
+            CursorResult[Any],
+            await db.execute(
+                update(AuthSession)
+                .where(
+                    AuthSession.tenant_id == tenant_id,
+                    AuthSession.user_id == user_id,
+                    AuthSession.revoked_at.is_(None),
                 )
-            )
-            .scalars()
-            .all()
+                .values(revoked_at=self._utcnow())
+            ),
         )
-        now = self._utcnow()
-        for s in sessions:
-            s.revoked_at = now
+        revoked = result.rowcount or 0
         db.add(
             SecurityEvent(
                 tenant_id=tenant_id,
                 actor_user_id=actor_id,
                 event_type="force_logout_all_sessions",
-                details=f"sessions_revoked={len(sessions)} user_id={user_id}",
+                details=f"sessions_revoked={revoked} user_id={user_id}",
             )
         )
-        return len(sessions)
+        return revoked
 
     async def change_password(
         self,
@@ -670,6 +677,6 @@ class AuthService:
 
         client_ip = ip_address(remote_ip)
         for entry in entries:
-            if client_ip in ip_network(entry.cidr, strict=False):
+            if client_ip in _parse_cidr(entry.cidr):
                 return True
         return False
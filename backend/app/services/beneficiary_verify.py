@@ -89,14 +89,19 @@ class _VerificationCache:
     implementation by configuring ``settings.REDIS_URL``.
     """
 
+    __slots__ = ("_store", "_ttl")
+
     def __init__(self) -> None:
-        self._store: dict[str, tuple[BeneficiaryVerifyResult, datetime]] = {}
+        self._store: dict[
+            tuple[uuid.UUID, str, str], tuple[BeneficiaryVerifyResult, datetime]
+        ] = {}
         self._ttl = timedelta(hours=24)
 
     def _key(
         self, tenant_id: uuid.UUID, company_name: str, vat_number: str | None
-    ) -> str:
-        return f"{tenant_id}:{company_name.lower()}:{vat_number or ''}"
+    ) -> tuple[uuid.UUID, str, str]:
+        # Tuple key — no string formatting per lookup.
+        return (tenant_id, company_name.lower(), vat_number or "")
 
     def get(
         self, tenant_id: uuid.UUID, company_name: str, vat_number: str | None
@@ -171,14 +176,17 @@ class BeneficiaryVerifyService:
             return self._client
         return httpx.Client(timeout=15.0)
 
-    def _ratio(self, a: str, b: str) -> float:
-        return SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
+    def _ratio(self, left_norm: str, right: str) -> float:
+        # Left side is pre-normalized by the caller (once per verification);
+        # only the API-returned name needs lowering/stripping here.
+        return SequenceMatcher(None, left_norm, right.lower().strip()).ratio()
 
     def _run_checks(self, request: BeneficiaryVerifyRequest) -> BeneficiaryVerifyResult:
-        ch_match, ch_status = self._check_companies_house(request.company_name)
-        vat_valid, vat_name_match = self._check_vat(
-            request.vat_number, request.company_name
+        name_norm = request.company_name.lower().strip()
+        ch_match, ch_status = self._check_companies_house(
+            request.company_name, name_norm
         )
+        vat_valid, vat_name_match = self._check_vat(request.vat_number, name_norm)
 
         # Determine action
         normalised_status = ch_status.lower()
@@ -212,7 +220,9 @@ class BeneficiaryVerifyService:
             alert_compliance_officer=alert_compliance_officer,
         )
 
-    def _check_companies_house(self, company_name: str) -> tuple[float, str]:
+    def _check_companies_house(
+        self, company_name: str, company_name_norm: str
+    ) -> tuple[float, str]:
         """Query Companies House and return (name_ratio, company_status).
 
         Returns (0.0, "unknown") on any API error so the caller can handle it
@@ -240,13 +250,13 @@ class BeneficiaryVerifyService:
             top = items[0]
             top_title: str = top.get("title", "")
             status: str = top.get("company_status", "unknown")
-            ratio = self._ratio(company_name, top_title)
+            ratio = self._ratio(company_name_norm, top_title)
             return round(ratio, 4), status
         except Exception:  # network / parse error
             return 0.0, "error"
 
     def _check_vat(
-        self, vat_number: str | None, beneficiary_name: str
+        self, vat_number: str | None, beneficiary_name_norm: str
     ) -> tuple[bool, float]:
         """Query HMRC VAT check and return (is_valid, name_ratio).
 
@@ -281,7 +291,7 @@ class BeneficiaryVerifyService:
             trader_name: str = target.get("name", "")
             if not trader_name:
                 return False, 0.0
-            ratio = self._ratio(beneficiary_name, trader_name)
+            ratio = self._ratio(beneficiary_name_norm, trader_name)
             return True, round(ratio, 4)
         except Exception:
             return False, 0.0
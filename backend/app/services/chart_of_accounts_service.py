@@ -450,29 +450,34 @@ class ChartOfAccountsService:
     async def seed_uk_standard(self) -> list[ChartOfAccount]:
         """Insert the full UK standard CoA for a new tenant (idempotent)."""
         created: list[ChartOfAccount] = []
-        for code, name, actype, subtype, hmrc, vat, is_treas, reval in UK_STANDARD_COA:
-            existing = await self._db.scalar(
-                select(ChartOfAccount).where(
-                    ChartOfAccount.tenant_id == self._tenant_id,
-                    ChartOfAccount.account_code == code,
-                )
+        # One query for the codes already present beats a SELECT per row of
+        # the standard chart on re-seeding.
+        existing_codes_result = await self._db.scalars(
+            select(ChartOfAccount.account_code).where(
+                ChartOfAccount.tenant_id == self._tenant_id
             )
-            if existing:
+        )
+        existing_codes = set(existing_codes_result.all())
+        for code, name, actype, subtype, hmrc, vat, is_treas, reval in UK_STANDARD_COA:
+            if code in existing_codes:
                 continue
-            obj = ChartOfAccount(
-                tenant_id=self._tenant_id,
-                account_code=code,
-                account_name=name,
-                account_type=actype,
-                account_subtype=subtype,
-                currency_code="GBP",
-                hmrc_nominal_code=hmrc,
-                vat_treatment=vat,
-                is_treasury_account=is_treas,
-                allows_currency_revaluation=reval,
+            created.append(
+                ChartOfAccount(
+                    tenant_id=self._tenant_id,
+                    account_code=code,
+                    account_name=name,
+                    account_type=actype,
+                    account_subtype=subtype,
+                    currency_code="GBP",
+                    hmrc_nominal_code=hmrc,
+                    vat_treatment=vat,
+                    is_treasury_account=is_treas,
+                    allows_currency_revaluation=reval,
+                )
             )
-            self._db.add(obj)
-            created.append(obj)
+        # Hand the whole chart to the session at once so the flush can batch
+        # the INSERTs (insertmanyvalues) rather than one statement per account.
+        self._db.add_all(created)
         await self._db.flush()
         return created
 
@@ -32,6 +32,12 @@ from app.models import (
 )
 from app.services.ledger_service import JournalCreate, JournalLineCreate, LedgerService
 
+# Decimal constants hoisted out of the per-rate / per-account loops.
+_ONE = Decimal("1")
+_ZERO = Decimal("0")
+_RATE_QUANTUM = Decimal("0.0000000001")
+_TWO_DP = Decimal("0.01")
+
 # ─────────────────────────────────────────────────── Pydantic schemas ──────────
 
 
@@ -108,17 +114,32 @@ class FxRevaluationService:
     # ──────────────────────────────────────── HMRC rate ingestion ──────────────
 
     async def ingest_rates(self, rates: list[HmrcRateIngest]) -> list[HmrcExchangeRate]:
-        """Idempotent upsert of HMRC published exchange rates."""
+        """Idempotent upsert of HMRC published exchange rates.
+
+        Existing rows for the batch's publication dates are fetched in one
+        query and matched in memory, so a monthly ingest issues two statements
+        rather than a SELECT per rate.
+        """
+        if not rates:
+            return []
+        existing_rows = await self._db.scalars(
+            select(HmrcExchangeRate).where(
+                HmrcExchangeRate.tenant_id == self._tenant_id,
+                HmrcExchangeRate.published_date.in_(
+                    {r.published_date for r in rates}
+                ),
+            )
+        )
+        by_key: dict[tuple[str, str, date], HmrcExchangeRate] = {
+            (row.base_currency, row.quote_currency, row.published_date): row
+            for row in existing_rows.all()
+        }
+
         created: list[HmrcExchangeRate] = []
+        new_rows: list[HmrcExchangeRate] = []
         for r in rates:
-            existing = await self._db.scalar(
-                select(HmrcExchangeRate).where(
-                    HmrcExchangeRate.tenant_id == self._tenant_id,
-                    HmrcExchangeRate.base_currency == r.base_currency,
-                    HmrcExchangeRate.quote_currency == r.quote_currency,
-                    HmrcExchangeRate.published_date == r.published_date,
-                )
-            )
+            key = (r.base_currency, r.quote_currency, r.published_date)
+            existing = by_key.get(key)
             if existing:
                 existing.rate = r.rate
                 existing.source_url = r.source_url
@@ -132,8 +153,10 @@ class FxRevaluationService:
                     published_date=r.published_date,
                     source_url=r.source_url,
                 )
-                self._db.add(obj)
+                by_key[key] = obj
+                new_rows.append(obj)
                 created.append(obj)
+        self._db.add_all(new_rows)
         await self._db.flush()
         return created
 
@@ -168,8 +191,8 @@ class FxRevaluationService:
                     if currency_code == "GBP" or len(currency_code) != 3:
                         continue
                     # HMRC publishes as: 1 GBP = N foreign → we store as 1 FCY = rate GBP
-                    gbp_per_fcy = (Decimal("1") / rate).quantize(
-                        Decimal("0.0000000001"), rounding=ROUND_HALF_UP
+                    gbp_per_fcy = (_ONE / rate).quantize(
+                        _RATE_QUANTUM, rounding=ROUND_HALF_UP
                     )
                     ingested.append(
                         HmrcRateIngest(
@@ -204,42 +227,68 @@ class FxRevaluationService:
         line_results: list[RevaluationLineResult] = []
         journal_lines_dr: list[JournalLineCreate] = []
         journal_lines_cr: list[JournalLineCreate] = []
-        total_gain_loss = Decimal("0")
+        reval_records: list[CurrencyRevaluation] = []
+        total_gain_loss = _ZERO
 
-        for acct in fc_accounts:
-            rate_row = await self._db.scalar(
-                select(HmrcExchangeRate)
-                .where(
-                    HmrcExchangeRate.tenant_id == self._tenant_id,
-                    HmrcExchangeRate.base_currency == acct.currency_code,
-                    HmrcExchangeRate.quote_currency == "GBP",
-                    HmrcExchangeRate.published_date <= request.period_end,
-                )
-                .order_by(HmrcExchangeRate.published_date.desc())
+        if not fc_accounts:
+            return RevaluationReport(
+                period_end=request.period_end,
+                total_gain_loss=total_gain_loss,
+                journal_id=uuid.UUID(int=0),
+                lines=line_results,
             )
+
+        # Prefetch the latest applicable HMRC rate per currency and the latest
+        # prior revaluation per account in one query each; the previous
+        # per-account SELECT pair made the loop O(2N) round-trips.
+        rate_rows = await self._db.scalars(
+            select(HmrcExchangeRate)
+            .where(
+                HmrcExchangeRate.tenant_id == self._tenant_id,
+                HmrcExchangeRate.base_currency.in_(
+                    {a.currency_code for a in fc_accounts}
+                ),
+                HmrcExchangeRate.quote_currency == "GBP",
+                HmrcExchangeRate.published_date <= request.period_end,
+            )
+            .order_by(HmrcExchangeRate.published_date.desc())
+        )
+        rate_by_currency: dict[str, HmrcExchangeRate] = {}
+        for row in rate_rows.all():
+            rate_by_currency.setdefault(row.base_currency, row)
+
+        prev_rows = await self._db.scalars(
+            select(CurrencyRevaluation)
+            .where(
+                CurrencyRevaluation.tenant_id == self._tenant_id,
+                CurrencyRevaluation.account_id.in_(
+                    {a.account_id for a in fc_accounts}
+                ),
+                CurrencyRevaluation.period_end < request.period_end,
+            )
+            .order_by(CurrencyRevaluation.period_end.desc())
+        )
+        prev_by_account: dict[uuid.UUID, CurrencyRevaluation] = {}
+        for prev_row in prev_rows.all():
+            prev_by_account.setdefault(prev_row.account_id, prev_row)
+
+        for acct in fc_accounts:
+            rate_row = rate_by_currency.get(acct.currency_code)
             if not rate_row:
                 continue
 
             # Get latest book balance from ledger_positions (GBP equivalent)
             # For this service we accept the existing balance from the revaluation table
-            # or derive from journal lines; here we query existing revaluation record
-            prev = await self._db.scalar(
-                select(CurrencyRevaluation)
-                .where(
-                    CurrencyRevaluation.tenant_id == self._tenant_id,
-                    CurrencyRevaluation.account_id == acct.account_id,
-                    CurrencyRevaluation.period_end < request.period_end,
-                )
-                .order_by(CurrencyRevaluation.period_end.desc())
-            )
+            # or derive from journal lines; here we use the prefetched revaluation record
+            prev = prev_by_account.get(acct.account_id)
             # book_value is the GBP-equivalent carried balance
-            book_value = prev.revalued_value if prev else Decimal("0")
+            book_value = prev.revalued_value if prev else _ZERO
             if book_value == 0:
                 continue
 
             # Revalue at HMRC period-end rate
             revalued = (book_value * rate_row.rate).quantize(
-                Decimal("0.01"), rounding=ROUND_HALF_UP
+                _TWO_DP, rounding=ROUND_HALF_UP
             )
             gain_loss = revalued - book_value
             if gain_loss == 0:
@@ -247,7 +296,8 @@ class FxRevaluationService:
 
             total_gain_loss += gain_loss
 
-            # Persist revaluation record
+            # Collect revaluation records; added to the session in one batch
+            # after the loop
             reval_rec = CurrencyRevaluation(
                 tenant_id=self._tenant_id,
                 period_end=request.period_end,
@@ -259,7 +309,7 @@ class FxRevaluationService:
                 revalued_value=revalued,
                 gain_loss=gain_loss,
             )
-            self._db.add(reval_rec)
+            reval_records.append(reval_rec)
 
             line_results.append(
                 RevaluationLineResult(
@@ -280,7 +330,7 @@ class FxRevaluationService:
                     JournalLineCreate(
                         account_id=acct.account_id,
                         debit_amount=gain_loss,
-                        credit_amount=Decimal("0"),
+                        credit_amount=_ZERO,
                         currency_code="GBP",
                         description=f"FX reval gain {acct.currency_code} @ {rate_row.rate}",
                         vat_treatment="T9",
@@ -289,7 +339,7 @@ class FxRevaluationService:
                 journal_lines_cr.append(
                     JournalLineCreate(
                         account_id=request.fx_gain_account_id,
-                        debit_amount=Decimal("0"),
+                        debit_amount=_ZERO,
                         credit_amount=gain_loss,
                         currency_code="GBP",
                         description=f"FX reval gain {acct.currency_code}",
@@ -302,7 +352,7 @@ class FxRevaluationService:
                     JournalLineCreate(
                         account_id=request.fx_loss_account_id,
                         debit_amount=loss,
-                        credit_amount=Decimal("0"),
+                        credit_amount=_ZERO,
                         currency_code="GBP",
                         description=f"FX reval loss {acct.currency_code}",
                         vat_treatment="T9",
@@ -311,7 +361,7 @@ class FxRevaluationService:
                 journal_lines_cr.append(
                     JournalLineCreate(
                         account_id=acct.account_id,
-                        debit_amount=Decimal("0"),
+                        debit_amount=_ZERO,
                         credit_amount=loss,
                         currency_code="GBP",
                         description=f"FX reval loss {acct.currency_code} @ {rate_row.rate}",
@@ -319,6 +369,7 @@ class FxRevaluationService:
                     )
                 )
 
+        self._db.add_all(reval_records)
         await self._db.flush()
 
         # Post combined gain/loss journal only if there are movements
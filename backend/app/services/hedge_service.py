@@ -337,9 +337,18 @@ class HedgeAccountingService:
     async def get_hedge_register(self) -> list[dict]:
         """Return hedge register summary suitable for PDF export / board report."""
         hedges = await self.list_designations(active_only=False)
+        # One query for every hedge's tests rather than one per hedge.
+        all_tests = await self._db.scalars(
+            select(HedgeEffectivenessTest)
+            .where(HedgeEffectivenessTest.tenant_id == self._tenant_id)
+            .order_by(HedgeEffectivenessTest.tested_at)
+        )
+        tests_by_hedge: dict[uuid.UUID, list[HedgeEffectivenessTest]] = {}
+        for t in all_tests.all():
+            tests_by_hedge.setdefault(t.hedge_id, []).append(t)
         register = []
         for h in hedges:
-            tests = await self.list_effectiveness_tests(h.hedge_id)
+            tests = tests_by_hedge.get(h.hedge_id, [])
             register.append(
                 {
                     "hedge_reference": h.hedge_reference,
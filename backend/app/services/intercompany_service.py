@@ -20,7 +20,7 @@ from decimal import Decimal
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -155,11 +155,16 @@ class IntercompanyService:
         return tx
 
     async def match_transaction(
-        self, transaction_id: uuid.UUID
+        self, transaction_id: uuid.UUID, as_of: date | None = None
     ) -> IntercompanyTransaction:
+        """Mark a transaction as matched, dated ``as_of`` (default today).
+
+        Bulk matching runs should compute the date once and pass it in, which
+        also keeps a batch consistent across a midnight boundary.
+        """
         tx = await self._get_tx(transaction_id)
         tx.is_matched = True
-        tx.matched_at = date.today()
+        tx.matched_at = as_of or date.today()
         await self._db.flush()
         return tx
 
@@ -190,12 +195,40 @@ class IntercompanyService:
     # ──────────────────────────────────────── ageing report ────────────────────
 
     async def ageing_report(self, reference_date: date) -> AgeingReport:
-        """Bucket all unmatched transactions by age (days overdue)."""
-        overdue_txs = await self._db.scalars(
-            select(IntercompanyTransaction).where(
+        """Bucket all unmatched transactions by age (days overdue).
+
+        Bucketing happens in SQL as a grouped aggregate, so the report never
+        hydrates individual transaction rows regardless of backlog size.
+        Age thresholds are expressed as due-date cutoffs (age <= N days is
+        equivalent to due_date >= reference_date - N days), which keeps the
+        CASE portable across Postgres and SQLite.
+        """
+        bucket_expr = case(
+            (
+                IntercompanyTransaction.due_date >= reference_date - timedelta(days=30),
+                "0-30",
+            ),
+            (
+                IntercompanyTransaction.due_date >= reference_date - timedelta(days=60),
+                "31-60",
+            ),
+            (
+                IntercompanyTransaction.due_date >= reference_date - timedelta(days=90),
+                "61-90",
+            ),
+            else_="90+",
+        )
+        rows = await self._db.execute(
+            select(
+                bucket_expr.label("bucket"),
+                func.count(IntercompanyTransaction.transaction_id),
+                func.sum(IntercompanyTransaction.principal_amount),
+            )
+            .where(
                 IntercompanyTransaction.tenant_id == self._tenant_id,
                 IntercompanyTransaction.is_matched.is_(False),
             )
+            .group_by(bucket_expr)
         )
         buckets: dict[str, dict[str, Decimal | int]] = {
             "0-30": {"count": 0, "total": Decimal("0")},
@@ -204,19 +237,11 @@ class IntercompanyService:
             "90+": {"count": 0, "total": Decimal("0")},
         }
         unmatched_total = Decimal("0")
-        for tx in overdue_txs.all():
-            age = (reference_date - tx.due_date).days
-            if age <= 30:
-                key = "0-30"
-            elif age <= 60:
-                key = "31-60"
-            elif age <= 90:
-                key = "61-90"
-            else:
-                key = "90+"
-            buckets[key]["count"] += 1
-            buckets[key]["total"] += tx.principal_amount
-            unmatched_total += tx.principal_amount
+        for bucket, count, total in rows.all():
+            total = Decimal(str(total)) if total is not None else Decimal("0")
+            buckets[bucket]["count"] = count
+            buckets[bucket]["total"] = total
+            unmatched_total += total
 
         return AgeingReport(
             reference_date=reference_date,
@@ -48,6 +48,11 @@ VAT_RATES: dict[str, Decimal] = {
 VAT_OUTPUT_ACCOUNT_CODE = "2001"  # VAT Payable
 VAT_INPUT_ACCOUNT_CODE = "1101"  # VAT Receivable
 
+# Hoisted Decimal constants — these run once per line on every create/post.
+_ZERO = Decimal("0")
+_BALANCE_QUANTUM = Decimal("0.0001")
+_VAT_QUANTUM = Decimal("0.01")
+
 
 # ─────────────────────────────────────────────────── Pydantic schemas ──────────
 
@@ -165,9 +170,12 @@ class LedgerService:
 
     @staticmethod
     def _check_balance(lines: list[JournalLineCreate]) -> None:
-        total_dr = sum(ln.debit_amount for ln in lines)
-        total_cr = sum(ln.credit_amount for ln in lines)
-        if total_dr.quantize(Decimal("0.0001")) != total_cr.quantize(Decimal("0.0001")):
+        # Single pass over the lines rather than one generator per side.
+        total_dr = total_cr = _ZERO
+        for ln in lines:
+            total_dr += ln.debit_amount
+            total_cr += ln.credit_amount
+        if total_dr.quantize(_BALANCE_QUANTUM) != total_cr.quantize(_BALANCE_QUANTUM):
             raise UnbalancedJournalError(str(total_dr), str(total_cr))
 
     # ──────────────────────────────────────── VAT expansion ────────────────────
@@ -179,6 +187,24 @@ class LedgerService:
     ) -> list[JournalLineCreate]:
         """For each T0/T1 line, generate a corresponding VAT line."""
         extra: list[JournalLineCreate] = []
+        if not any(
+            ln.vat_treatment
+            and ln.vat_treatment not in ("T2", "T4", "T7", "T9")
+            and VAT_RATES[ln.vat_treatment] != 0
+            for ln in lines
+        ):
+            return extra
+        # Both VAT control accounts are fetched once per journal; the previous
+        # per-line SELECT repeated the same two lookups for every taxable line.
+        vat_accounts_result = await self._db.scalars(
+            select(ChartOfAccount).where(
+                ChartOfAccount.tenant_id == self._tenant_id,
+                ChartOfAccount.account_code.in_(
+                    (VAT_INPUT_ACCOUNT_CODE, VAT_OUTPUT_ACCOUNT_CODE)
+                ),
+            )
+        )
+        vat_account_by_code = {a.account_code: a for a in vat_accounts_result.all()}
         for ln in lines:
             if not ln.vat_treatment or ln.vat_treatment in ("T2", "T4", "T7", "T9"):
                 continue
@@ -186,25 +212,19 @@ class LedgerService:
             if rate == 0:
                 continue
             base = ln.debit_amount or ln.credit_amount
-            vat_amount = (base * rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            # Look up the VAT account
+            vat_amount = (base * rate).quantize(_VAT_QUANTUM, rounding=ROUND_HALF_UP)
             is_debit_side = ln.debit_amount > 0
             vat_code = (
                 VAT_INPUT_ACCOUNT_CODE if is_debit_side else VAT_OUTPUT_ACCOUNT_CODE
             )
-            vat_account = await self._db.scalar(
-                select(ChartOfAccount).where(
-                    ChartOfAccount.tenant_id == self._tenant_id,
-                    ChartOfAccount.account_code == vat_code,
-                )
-            )
+            vat_account = vat_account_by_code.get(vat_code)
             if vat_account is None:
                 continue  # VAT account not seeded yet; skip silently
             extra.append(
                 JournalLineCreate(
                     account_id=vat_account.account_id,
-                    debit_amount=vat_amount if is_debit_side else Decimal("0"),
-                    credit_amount=vat_amount if not is_debit_side else Decimal("0"),
+                    debit_amount=vat_amount if is_debit_side else _ZERO,
+                    credit_amount=vat_amount if not is_debit_side else _ZERO,
                     currency_code=currency,
                     description=f"Auto VAT ({ln.vat_treatment})",
                     vat_treatment=ln.vat_treatment,
@@ -247,8 +267,11 @@ class LedgerService:
                 # auto-balance the rounding if needed (should be zero)
                 pass  # VAT by construction is equal Dr = Cr per pair
 
-        for order, ln in enumerate(all_lines):
-            self._db.add(
+        # Build every line up front and hand them to the session in one go so
+        # the flush can batch the INSERTs (insertmanyvalues) instead of
+        # issuing one statement per line.
+        self._db.add_all(
+            [
                 JournalLine(
                     tenant_id=self._tenant_id,
                     journal_id=journal.journal_id,
@@ -260,7 +283,9 @@ class LedgerService:
                     vat_treatment=ln.vat_treatment,
                     line_order=ln.line_order if ln.line_order else order,
                 )
-            )
+                for order, ln in enumerate(all_lines)
+            ]
+        )
         await self._db.flush()
         return await self._get_journal_with_lines(journal.journal_id)
 
@@ -273,8 +298,10 @@ class LedgerService:
         await self._assert_period_open(journal.period_id)
 
         # Final balance check against persisted lines
-        total_dr = sum(ln.debit_amount for ln in journal.lines)
-        total_cr = sum(ln.credit_amount for ln in journal.lines)
+        total_dr = total_cr = _ZERO
+        for ln in journal.lines:
+            total_dr += ln.debit_amount
+            total_cr += ln.credit_amount
         if total_dr != total_cr:
             raise UnbalancedJournalError(str(total_dr), str(total_cr))
 
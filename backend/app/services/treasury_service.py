@@ -17,6 +17,7 @@ import uuid
 from calendar import monthrange
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -24,14 +25,30 @@ from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 
 
+# Hoisted Decimal constants — constructing Decimal from str parses the
+# literal on every call, which adds up inside the per-row loops below.
+_ZERO = Decimal("0")
+_TWO_PLACES = Decimal("0.01")
+_HUNDRED = Decimal("100")
+_CONFIDENCE_FLOOR = Decimal("0.40")
+_REVIEW_AMOUNT_THRESHOLD = Decimal("1000000")
+_REVIEW_CONFIDENCE_CEILING = Decimal("0.90")
+
+
 def _round_2(value: Decimal) -> Decimal:
-    return value.quantize(Decimal("0.01"))
+    return value.quantize(_TWO_PLACES)
 
 
 def _hash_text(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
+def _hash_bytes(value: bytes) -> str:
+    # Feed binary payloads to sha256 directly; round-tripping through .hex()
+    # doubled the input and re-encoded it before hashing.
+    return hashlib.sha256(value).hexdigest()
+
+
 def _env_flag(name: str, default: bool = False) -> bool:
     value = os.getenv(name)
     if value is None:
@@ -71,27 +88,27 @@ class PositionRow(BaseModel):
     account_id: str
     currency: str = Field(min_length=3, max_length=3)
     balance: Decimal
-    fx_to_base: Decimal = Field(default=Decimal("1"), gt=Decimal("0"))
+    fx_to_base: Decimal = Field(default=Decimal("1"), gt=_ZERO)
     maturity_days: int = Field(default=0)
-    minimum_balance: Decimal = Field(default=Decimal("0"))
-    overdraft_limit: Decimal = Field(default=Decimal("0"))
-    overdraft_used: Decimal = Field(default=Decimal("0"))
+    minimum_balance: Decimal = Field(default=_ZERO)
+    overdraft_limit: Decimal = Field(default=_ZERO)
+    overdraft_used: Decimal = Field(default=_ZERO)
 
 
 class PaymentQueueItem(BaseModel):
     account_id: str
-    amount_base: Decimal = Field(ge=Decimal("0"))
+    amount_base: Decimal = Field(ge=_ZERO)
 
 
 class FacilityRow(BaseModel):
     facility_name: str
     bank: str
-    limit_amount: Decimal = Field(ge=Decimal("0"))
-    current_drawn: Decimal = Field(ge=Decimal("0"))
+    limit_amount: Decimal = Field(ge=_ZERO)
+    current_drawn: Decimal = Field(ge=_ZERO)
 
     @property
     def undrawn(self) -> Decimal:
-        return max(Decimal("0"), self.limit_amount - self.current_drawn)
+        return max(_ZERO, self.limit_amount - self.current_drawn)
 
 
 class PositionRequest(BaseModel):
@@ -177,17 +194,17 @@ class HmrcScheduleRequest(BaseModel):
     cis_months: list[date] = Field(default_factory=list)
     cis_payment_method: Literal["cheque", "electronic"] = "electronic"
     confirmation_statement_anniversary: date
-    estimated_vat_amount: Decimal = Decimal("0")
-    estimated_ct_amount: Decimal = Decimal("0")
-    estimated_paye_amount: Decimal = Decimal("0")
-    estimated_cis_amount: Decimal = Decimal("0")
+    estimated_vat_amount: Decimal = _ZERO
+    estimated_ct_amount: Decimal = _ZERO
+    estimated_paye_amount: Decimal = _ZERO
+    estimated_cis_amount: Decimal = _ZERO
 
 
 class ForecastRowInput(BaseModel):
     account_id: str
     forecast_date: date
     amount: Decimal
-    confidence: Decimal = Field(ge=Decimal("0"), le=Decimal("1"))
+    confidence: Decimal = Field(ge=_ZERO, le=Decimal("1"))
 
 
 class ForecastInferenceRequest(BaseModel):
@@ -196,7 +213,7 @@ class ForecastInferenceRequest(BaseModel):
     as_of: date
     horizon_days: int = Field(default=90, ge=1, le=366)
     rows: list[ForecastRowInput]
-    amount_bound: Decimal = Field(default=Decimal("50000000"), gt=Decimal("0"))
+    amount_bound: Decimal = Field(default=Decimal("50000000"), gt=_ZERO)
     provider: Literal["ollama", "claude", "gemini"] | None = None
     model_version: str = "claude-sonnet-4-6"
     prompt: str
@@ -386,8 +403,8 @@ class TreasuryService:
         digital_signature = _hash_text(
             report_id
             + generated_at.isoformat()
-            + _hash_text(pdf_bytes.hex())
-            + _hash_text(excel_bytes.hex())
+            + _hash_bytes(pdf_bytes)
+            + _hash_bytes(excel_bytes)
         )
         audit_log = {
             "report_id": report_id,
@@ -411,7 +428,9 @@ class TreasuryService:
     def report_audit_history(self, *, limit: int = 100) -> list[ReportAuditEvent]:
         if limit < 1:
             limit = 1
-        ordered = list(reversed(self._report_audit_events))[:limit]
+        # Slice the newest events first, then reverse: copying the full
+        # history just to keep the top of it grows with every export.
+        ordered = self._report_audit_events[-limit:][::-1]
         return [
             ReportAuditEvent(
                 report_id=event["report_id"],
@@ -438,6 +457,10 @@ class TreasuryService:
 
     @staticmethod
     def _to_base(row: PositionRow) -> Decimal:
+        # Rows already in base currency carry fx_to_base == 1; skip the
+        # Decimal multiply for that (very common) case.
+        if row.fx_to_base == 1:
+            return _round_2(row.balance)
         return _round_2(row.balance * row.fx_to_base)
 
     def consolidated_position(self, payload: PositionRequest) -> ConsolidatedPosition:
@@ -446,26 +469,26 @@ class TreasuryService:
         by_account: dict[str, Decimal] = {}
         by_currency: dict[str, Decimal] = {}
         buckets = {
-            "same_day": Decimal("0"),
-            "d1_7": Decimal("0"),
-            "d8_30": Decimal("0"),
-            "d31_90": Decimal("0"),
-            "d90_plus": Decimal("0"),
+            "same_day": _ZERO,
+            "d1_7": _ZERO,
+            "d8_30": _ZERO,
+            "d31_90": _ZERO,
+            "d90_plus": _ZERO,
         }
 
-        total = Decimal("0")
+        total = _ZERO
         for row in payload.rows:
             amount_base = self._to_base(row)
             total += amount_base
             by_entity[row.entity] = (
-                by_entity.get(row.entity, Decimal("0")) + amount_base
+                by_entity.get(row.entity, _ZERO) + amount_base
             )
-            by_bank[row.bank] = by_bank.get(row.bank, Decimal("0")) + amount_base
+            by_bank[row.bank] = by_bank.get(row.bank, _ZERO) + amount_base
             by_account[row.account_id] = (
-                by_account.get(row.account_id, Decimal("0")) + amount_base
+                by_account.get(row.account_id, _ZERO) + amount_base
             )
             by_currency[row.currency] = (
-                by_currency.get(row.currency, Decimal("0")) + row.balance
+                by_currency.get(row.currency, _ZERO) + row.balance
             )
             buckets[self._bucket(row.maturity_days)] += amount_base
 
@@ -482,15 +505,20 @@ class TreasuryService:
     def simulate_intraday_sweep(
         self, payload: SweepSimulationRequest
     ) -> SweepSimulationResponse:
-        before = self.consolidated_position(
-            PositionRequest(base_currency=payload.base_currency, rows=payload.rows)
-        ).consolidated_group_position
-        by_account_after = {row.account_id: self._to_base(row) for row in payload.rows}
-        queue_total = Decimal("0")
+        # Single pass: converting each row once covers both the opening
+        # position and the per-account map, instead of running the full
+        # consolidated_position aggregation and then re-converting every row.
+        before = _ZERO
+        by_account_after: dict[str, Decimal] = {}
+        for row in payload.rows:
+            amount_base = self._to_base(row)
+            before += amount_base
+            by_account_after[row.account_id] = amount_base
+        queue_total = _ZERO
         for pmt in payload.proposed_payments:
             queue_total += pmt.amount_base
             by_account_after[pmt.account_id] = (
-                by_account_after.get(pmt.account_id, Decimal("0")) - pmt.amount_base
+                by_account_after.get(pmt.account_id, _ZERO) - pmt.amount_base
             )
         after = before - queue_total
         return SweepSimulationResponse(
@@ -503,9 +531,9 @@ class TreasuryService:
     def available_liquidity_and_alerts(
         self, payload: LiquidityRequest
     ) -> LiquidityResponse:
-        cash_total = sum((self._to_base(row) for row in payload.rows), Decimal("0"))
-        undrawn_total = sum((fac.undrawn for fac in payload.facilities), Decimal("0"))
-        queue_total = sum((p.amount_base for p in payload.payment_queue), Decimal("0"))
+        cash_total = sum((self._to_base(row) for row in payload.rows), _ZERO)
+        undrawn_total = sum((fac.undrawn for fac in payload.facilities), _ZERO)
+        queue_total = sum((p.amount_base for p in payload.payment_queue), _ZERO)
         available = cash_total + undrawn_total - queue_total
 
         alerts: list[LiquidityAlert] = []
@@ -520,8 +548,10 @@ class TreasuryService:
                     )
                 )
             if row.overdraft_limit > 0:
-                usage = row.overdraft_used / row.overdraft_limit
-                if usage >= payload.overdraft_alert_pct:
+                # Compare via multiplication; the division for the percentage
+                # message only runs when the alert actually fires.
+                if row.overdraft_used >= payload.overdraft_alert_pct * row.overdraft_limit:
+                    usage = row.overdraft_used / row.overdraft_limit
                     alerts.append(
                         LiquidityAlert(
                             alert_type="overdraft_approach",
@@ -532,13 +562,14 @@ class TreasuryService:
 
         by_bank: dict[str, Decimal] = {}
         for row in payload.rows:
-            by_bank[row.bank] = by_bank.get(row.bank, Decimal("0")) + self._to_base(row)
+            by_bank[row.bank] = by_bank.get(row.bank, _ZERO) + self._to_base(row)
 
-        positive_cash = max(Decimal("0"), cash_total)
+        positive_cash = max(_ZERO, cash_total)
         if positive_cash > 0:
+            concentration_limit = payload.concentration_threshold * positive_cash
             for bank, amount in by_bank.items():
-                concentration = amount / positive_cash
-                if concentration > payload.concentration_threshold:
+                if amount > concentration_limit:
+                    concentration = amount / positive_cash
                     alerts.append(
                         LiquidityAlert(
                             alert_type="concentration_risk",
@@ -550,7 +581,7 @@ class TreasuryService:
         covenant_headroom: dict[str, Decimal] = {}
         for fac in payload.facilities:
             if fac.limit_amount <= 0:
-                covenant_headroom[fac.facility_name] = Decimal("0")
+                covenant_headroom[fac.facility_name] = _ZERO
                 continue
             headroom_pct = (fac.limit_amount - fac.current_drawn) / fac.limit_amount
             covenant_headroom[fac.facility_name] = _round_2(headroom_pct)
@@ -573,24 +604,31 @@ class TreasuryService:
         )
 
     @staticmethod
-    def _vat_reference(tenant_id: uuid.UUID, due_date: date) -> str:
-        return f"VAT-{str(tenant_id).split('-')[0]}-{due_date.strftime('%Y%m%d')}"
+    @lru_cache(maxsize=256)
+    def _tenant_ref_prefix(tenant_id: uuid.UUID) -> str:
+        # Memoized: every payment reference for a schedule shares the same
+        # prefix, and the set of tenants per process is small.
+        return str(tenant_id).split("-")[0]
 
-    @staticmethod
-    def _ct_reference(tenant_id: uuid.UUID, year_end: date) -> str:
-        return f"CT-{str(tenant_id).split('-')[0]}-{year_end.strftime('%Y%m%d')}"
+    @classmethod
+    def _vat_reference(cls, tenant_id: uuid.UUID, due_date: date) -> str:
+        return f"VAT-{cls._tenant_ref_prefix(tenant_id)}-{due_date.strftime('%Y%m%d')}"
 
-    @staticmethod
-    def _paye_reference(tenant_id: uuid.UUID, period_end: date) -> str:
-        return f"PAYE-{str(tenant_id).split('-')[0]}-{period_end.strftime('%Y%m')}"
+    @classmethod
+    def _ct_reference(cls, tenant_id: uuid.UUID, year_end: date) -> str:
+        return f"CT-{cls._tenant_ref_prefix(tenant_id)}-{year_end.strftime('%Y%m%d')}"
 
-    @staticmethod
-    def _cis_reference(tenant_id: uuid.UUID, period_end: date) -> str:
-        return f"CIS-{str(tenant_id).split('-')[0]}-{period_end.strftime('%Y%m')}"
+    @classmethod
+    def _paye_reference(cls, tenant_id: uuid.UUID, period_end: date) -> str:
+        return f"PAYE-{cls._tenant_ref_prefix(tenant_id)}-{period_end.strftime('%Y%m')}"
 
-    @staticmethod
-    def _ch_reference(tenant_id: uuid.UUID, anniversary: date) -> str:
-        return f"CH-{str(tenant_id).split('-')[0]}-{anniversary.strftime('%Y%m%d')}"
+    @classmethod
+    def _cis_reference(cls, tenant_id: uuid.UUID, period_end: date) -> str:
+        return f"CIS-{cls._tenant_ref_prefix(tenant_id)}-{period_end.strftime('%Y%m')}"
+
+    @classmethod
+    def _ch_reference(cls, tenant_id: uuid.UUID, anniversary: date) -> str:
+        return f"CH-{cls._tenant_ref_prefix(tenant_id)}-{anniversary.strftime('%Y%m%d')}"
 
     def populate_hmrc_obligations(
         self, payload: HmrcScheduleRequest
@@ -680,7 +718,7 @@ class TreasuryService:
             HmrcObligation(
                 obligation_type="CONFIRMATION_STATEMENT",
                 due_date=payload.confirmation_statement_anniversary,
-                estimated_amount=Decimal("0"),
+                estimated_amount=_ZERO,
                 urgency_colour=_urgency(
                     payload.confirmation_statement_anniversary, payload.as_of
                 ),
@@ -756,7 +794,7 @@ class TreasuryService:
         for row in payload.rows:
             account_ref_hash = _hash_text(row.account_id)
             reasons: list[str] = []
-            if row.confidence < Decimal("0.40"):
+            if row.confidence < _CONFIDENCE_FLOOR:
                 reasons.append("confidence_below_floor")
             if abs(row.amount) > payload.amount_bound:
                 reasons.append("amount_out_of_bounds")
@@ -782,8 +820,8 @@ class TreasuryService:
                     amount=_round_2(row.amount),
                     confidence=row.confidence,
                     human_review_required=(
-                        abs(row.amount) > Decimal("1000000")
-                        or row.confidence > Decimal("0.90")
+                        abs(row.amount) > _REVIEW_AMOUNT_THRESHOLD
+                        or row.confidence > _REVIEW_CONFIDENCE_CEILING
                     ),
                 )
             )
@@ -873,12 +911,12 @@ class TreasuryService:
         for forecast, actual in payload.forecast_actual_pairs:
             if actual == 0:
                 continue
-            abs_pct_errors.append(abs((actual - forecast) / actual) * Decimal("100"))
+            abs_pct_errors.append(abs((actual - forecast) / actual) * _HUNDRED)
 
         mape = (
-            (sum(abs_pct_errors, Decimal("0")) / Decimal(len(abs_pct_errors)))
+            (sum(abs_pct_errors, _ZERO) / Decimal(len(abs_pct_errors)))
             if abs_pct_errors
-            else Decimal("0")
+            else _ZERO
         )
         return WeeklySummaryReport(
             week_start=payload.week_start,
@@ -963,7 +1001,7 @@ class TreasuryService:
         excel_bytes = "\n".join(csv_lines).encode("utf-8")
 
         digital_signature = _hash_text(
-            report_id + generated_at.isoformat() + _hash_text(pdf_bytes.hex())
+            report_id + generated_at.isoformat() + _hash_bytes(pdf_bytes)
         )
         audit_log = {
             "report_id": report_id,
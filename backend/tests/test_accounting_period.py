@@ -212,7 +212,7 @@ async def test_qip_dates_for_large_company():
 @pytest.mark.asyncio
 async def test_no_qip_for_standard_company():
     _, qips = _compute_tax_dates(date(2026, 12, 31), large_company=False)
-    assert qips == []
+    assert not qips
 
 
 @pytest.mark.asyncio
@@ -105,6 +105,19 @@ async def test_match_transaction(db: AsyncSession, tenant: Tenant, tenant_id, us
     assert matched.matched_at == date.today()
 
 
+@pytest.mark.asyncio
+async def test_match_transaction_with_explicit_as_of(
+    db: AsyncSession, tenant: Tenant, tenant_id, user_id
+):
+    """Bulk matching runs pass a precomputed date; it must be stored verbatim."""
+    svc = _svc(db, tenant_id, user_id)
+    tx = await svc.create_transaction(_tx_payload())
+    as_of = date(2026, 6, 30)
+    matched = await svc.match_transaction(tx.transaction_id, as_of=as_of)
+    assert matched.is_matched is True
+    assert matched.matched_at == as_of
+
+
 @pytest.mark.asyncio
 async def test_list_unmatched(db: AsyncSession, tenant: Tenant, tenant_id, user_id):
     svc = _svc(db, tenant_id, user_id)
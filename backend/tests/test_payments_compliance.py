@@ -116,6 +116,38 @@ def test_sanctions_match_freezes_and_logs() -> None:
     assert out.sanctions_match_score >= Decimal("85")
 
 
+def test_exact_sanctions_match_short_circuits_with_one_log() -> None:
+    svc = PaymentsComplianceService()
+    out = svc.initiate_payment(
+        _payment_payload(
+            beneficiary_name="Bank Melli Iran",
+            registered_company_name="Bank Melli Iran",
+        )
+    )
+    assert out.frozen is True
+    assert out.sanctions_match_score == Decimal("100")
+    logs = [l for l in svc.screening_logs() if l.payment_id == out.payment_id]
+    assert len(logs) == 1
+    assert logs[0].sanctions_entity == "Bank Melli Iran"
+    assert logs[0].threshold_hit is True
+
+
+def test_near_miss_sanctions_name_logged_via_fuzzy_path() -> None:
+    svc = PaymentsComplianceService()
+    out = svc.initiate_payment(
+        _payment_payload(
+            beneficiary_name="Bank Melli Iran Ltd",
+            registered_company_name="Bank Melli Iran Ltd",
+        )
+    )
+    # Not an exact list entry, so the fuzzy loop must score and log it.
+    assert Decimal("60") <= out.sanctions_match_score < Decimal("100")
+    logs = [l for l in svc.screening_logs() if l.payment_id == out.payment_id]
+    assert logs
+    assert logs[0].sanctions_entity == "Bank Melli Iran"
+    assert logs[0].match_score == out.sanctions_match_score
+
+
 def test_four_eyes_initiator_cannot_approve() -> None:
     svc = PaymentsComplianceService()
     p = _payment_payload()